@@ -291,6 +291,42 @@ class Board:
         return [(i % self._num_cols, i // self._num_cols) \
                     for i, item in enumerate(self._grid) if fn(item)]
 
+    def make_validator(self, empty_item=None, allow_above=False):
+        """Create a function that checks if a coordinate (x, y) is within
+            *this* board and holds empty_item. The grid and dimensions are
+            captured as locals, so the returned function must be rebuilt
+            after update_grid, or after rows are deleted or inserted
+        Parameters
+        ----------
+        empty_item (any, optional):
+            the item of an empty cell. Defaults to None.
+        allow_above (bool, optional):
+            also accept coordinates above the board (y < 0) whose x is
+            within the board. Defaults to False.
+        Returns
+        -------
+        (tuple[int, int]) -> bool:
+            a validator suited for Pytromino.validated_apply
+        >>> board = Board(3, 2, grid=[0, 1, 0, 0, 0, 1])
+        >>> is_empty = board.make_validator(0)
+        >>> [is_empty((x, 0)) for x in range(3)]
+        [True, False, True]
+        >>> is_empty((2, 1)), is_empty((3, 0)), is_empty((0, -1))
+        (False, False, False)
+        >>> board.make_validator(0, allow_above=True)((0, -1))
+        True
+        """
+        grid = self._grid
+        num_cols, num_rows = self._num_cols, self._num_rows
+        def validator(pos):
+            x, y = pos
+            if not 0 <= x < num_cols:
+                return False
+            if y < 0:
+                return allow_above
+            return y < num_rows and grid[y * num_cols + x] == empty_item
+        return validator
+
     def update_grid(self, new_grid):
         """ Overwrite existing underlying board with a new board
         """
@@ -34,6 +34,12 @@ class PytrisController:
         self._pyg = gui.get_pygame()
         self._holder = Holder()
         self._empty_cell_color = self._gui.get_rect_color()
+        # Shift functions are created once, not on every key press or tick
+        self._shift_down_1 = Pytromino.shift_down_fn(1)
+        self._shift_left_1 = Pytromino.shift_left_fn(1)
+        self._shift_right_1 = Pytromino.shift_right_fn(1)
+        # Rebuilt whenever board rows change, see _make_block_validator
+        self._block_validator = self._make_block_validator()
         # Seed PRNG before creating nextup
         seed(a)
         self._nextup = deque(
@@ -89,6 +95,7 @@ class PytrisController:
         self._score = 0
         self._game_over = False
         self._level = 1
+        self._block_validator = self._make_block_validator()
         self._gui.init_window()
         self._init_new_pytromino()
 
@@ -110,7 +117,7 @@ class PytrisController:
             # Automatic shift down 1
             cur_time = self._pyg.time.get_ticks()
             if cur_time - prev_time >= 1000/cur_speed:
-                success = self._move_cur_pytromino(Pytromino.shift_down_fn(1))
+                success = self._move_cur_pytromino(self._shift_down_1)
                 # Pytromino can't go down anymore
                 if not success:
                     # Freeze position to board
@@ -169,6 +176,8 @@ class PytrisController:
             self._board.insert_row_at(0, 
                 [self._empty_cell_color for _ in range(self._num_cols)])
         if cleared_rows:
+            # Rows were deleted/inserted above, rebuild the validator
+            self._block_validator = self._make_block_validator()
             # Each cleared row is worth 100 points for now
             self._increment_score_by(100 * len(cleared_rows))
             # Redraw all board squares
@@ -201,22 +210,28 @@ class PytrisController:
         # For better UX, render rightaway
         self._gui.render()
 
-    def _cur_pytromino_block_validator(self, pos):
-        if pos[1] < 0:
-            return 0 <= pos[0] < self._num_cols
-        return self._board.valid_coordinate(pos) \
-            and self._board[pos] == self._empty_cell_color
+    def _make_block_validator(self):
+        """ Create the validator for the current pytromino's blocks, blocks
+            above the board are allowed while spawning. Must be rebuilt
+            after rows are deleted or inserted
+        """
+        return self._board.make_validator(self._empty_cell_color, allow_above=True)
         
-    def _move_cur_pytromino(self, fn, is_rotation=False):
+    def _move_cur_pytromino(self, fn=None, is_rotation=False):
         assert self._cur_pytromino.is_placed()
         src_pos = self._cur_pytromino.filter_blocks_pos(
             self._board.valid_coordinate
         )
-        success = self._cur_pytromino.validated_apply(
-            fn, 
-            is_rotation,
-            validator=self._cur_pytromino_block_validator,
-        )
+        if is_rotation:
+            success = self._cur_pytromino.rotate_cw(
+                self._block_validator
+            )
+        else:
+            success = self._cur_pytromino.validated_apply(
+                fn,
+                False,
+                validator=self._block_validator,
+            )
         if success:
             dest_pos = self._cur_pytromino.filter_blocks_pos(
                 self._board.valid_coordinate
@@ -235,14 +250,13 @@ class PytrisController:
         fn = None
         is_rotation = False
         if key == K_DOWN:
-            fn = Pytromino.shift_down_fn(1)
+            fn = self._shift_down_1
         elif key == K_LEFT:
-            fn = Pytromino.shift_left_fn(1)
+            fn = self._shift_left_1
         elif key == K_RIGHT:
-            fn = Pytromino.shift_right_fn(1)
+            fn = self._shift_right_1
         elif key == K_UP:
             is_rotation = True
-            fn = self._rotate_block_90_cw
         else:
             if key == K_f:
                 print(self._fps_clock.get_fps())
@@ -253,11 +267,6 @@ class PytrisController:
         if key == K_DOWN and success:
             self._increment_score_by(1)
 
-    def _rotate_block_90_cw(self, pos):
-        res = self._cur_pytromino.rotate_block_90_cw(pos)
-        res = (int(res[0]), int(res[1]))
-        return res
-
     def _increment_score_by(self, num):
         self._score += num
         self._gui.update_score(self._score)
@@ -286,7 +295,7 @@ class PytrisController:
         can_hold = self._holder.is_open()
         if can_hold:
             next_pytromino_t = self._holder.get_item()
-            if not next_pytromino_t: # holder is empty
+            if next_pytromino_t is None: # holder is empty
                 # Reflect the change on holder display
                 self._gui.init_pytro_holder()
                 display_pytro = pytromino_factory(self._cur_pytromino.get_type())
@@ -305,7 +314,7 @@ class PytrisController:
                 next_pytromino = pytromino_factory(next_pytromino_t)
                 next_pytromino.place_at(cur_pytromino_center)
                 for pos in next_pytromino.get_blocks_pos():
-                    if not self._cur_pytromino_block_validator(pos):
+                    if not self._block_validator(pos):
                         return False
                 # Reflect the change on holder display
                 self._gui.init_pytro_holder()
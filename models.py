@@ -1,19 +1,43 @@
-from enum import Enum, auto
+from enum import IntEnum
+from functools import lru_cache
 from colors import Color
 
+_CYAN, _YELLOW, _ORANGE, _GREEN, _PURPLE, _BLUE, _RED = (
+    Color.CYAN.value, Color.YELLOW.value, Color.ORANGE.value, Color.GREEN.value,
+    Color.PURPLE.value, Color.BLUE.value, Color.RED.value
+)
+
+# SRS wall kick offsets (dx, dy) tried in order when rotating clockwise,
+# indexed by the rotation state being left. dy grows downwards.
+_KICKS_JLSTZ = (
+    ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),  # 0 -> R
+    ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),    # R -> 2
+    ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),     # 2 -> L
+    ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)), # L -> 0
+)
+_KICKS_I = (
+    ((0, 0), (-2, 0), (1, 0), (-2, 1), (1, -2)),   # 0 -> R
+    ((0, 0), (-1, 0), (2, 0), (-1, -2), (2, 1)),   # R -> 2
+    ((0, 0), (2, 0), (-1, 0), (2, -1), (-1, 2)),   # 2 -> L
+    ((0, 0), (1, 0), (-2, 0), (1, 2), (-2, -1)),   # L -> 0
+)
+_KICKS_O = ((0, 0),)
+
 
 class Pytromino:
     """An object to represent a block of squares
     """
 
-    class Types(Enum):
-        I = auto()
-        O = auto()
-        L = auto()
-        S = auto()
-        T = auto()
-        J = auto()
-        Z = auto()
+    class Types(IntEnum):
+        I = 0
+        O = 1
+        L = 2
+        S = 3
+        T = 4
+        J = 5
+        Z = 6
+
+    __slots__ = ('_blocks_pos', '_color', '_type', '_center_rot', '_placed')
 
     def __init__(self, block_rel_pos, color, pytromino_type, center_rot=(0, 0)):
         """ Create a new Pytromino instance. A pytromino consists of a list of
@@ -24,8 +48,8 @@ class Pytromino:
             it does not have to be (0, 0).
         Parameters
         ----------
-        block_rel_pos (list[tuple[int, int]]): A list of tuples (x, y) that
-            represent a block's relative position to the center
+        block_rel_pos (sequence[tuple[int, int]]): A list or tuple of tuples (x, y)
+            that represent a block's relative position to the center
         color (tuple[int, int, int]): RGB colors of this Pytromino
 
         pytromino_type (Pytromino.Types): Type of Pytromino
@@ -33,9 +57,8 @@ class Pytromino:
         center_rot (tuple[number, number], optional): Center of rotation coordinate
             relative to the (0, 0) reference block. Defaults to (0, 0).
         """
-        assert isinstance(pytromino_type, Pytromino.Types)
-        assert type(color) == tuple
-        self._blocks_pos = block_rel_pos
+        assert type(pytromino_type) is Pytromino.Types and type(color) is tuple
+        self._blocks_pos = tuple(block_rel_pos)
         self._color = color
         self._type = pytromino_type
         self._center_rot = center_rot
@@ -208,13 +231,98 @@ class Pytromino:
 # --------------------------- Helpers: Not Required -------------------------- #
 # ---------------------------------------------------------------------------- #
 
+    def _set_blocks_if_valid(self, new_blocks, validator):
+        """ Replace blocks_pos with the tuple new_blocks only if ALL of
+            them pass validator, stopping at the first one that fails
+        """
+        for pos in new_blocks:
+            if not validator(pos):
+                return False
+        self._blocks_pos = new_blocks
+        return True
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _frame(pytromino_type, rot_index):
+        """ Returns the blocks of a factory made pytromino of pytromino_type
+            after rot_index clockwise rotations, relative to its reference
+            block. Memoized, each of the 28 frames is only computed once
+        """
+        blocks, _, (cx, cy) = _SPECS[pytromino_type]
+        if rot_index == 0:
+            return blocks
+        return tuple(
+            (int(cy - y + cx), int(x - cx + cy))
+            for x, y in Pytromino._frame(pytromino_type, rot_index - 1)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _rot_states(pytromino_type):
+        """ Returns a dict from the shape of each frame of pytromino_type,
+            relative to its reference block, to that frame's rotation index
+        """
+        states = {}
+        for rot_index in range(4):
+            frame = Pytromino._frame(pytromino_type, rot_index)
+            x0, y0 = frame[0]
+            states[tuple((x - x0, y - y0) for x, y in frame)] = rot_index
+        return states
+
+    def rotate_cw(self, validator=lambda pos: True):
+        """ Rotate *this* pytromino 90 degrees clockwise using the
+            memoized rotation frames of its type. When the rotated blocks
+            fail the validator, the SRS wall kick offsets are tried in order
+            and the first one that passes is applied. The current rotation
+            state is read from the blocks themselves; blocks that match no
+            frame of the pytromino's type are not rotated. Same
+            all-or-nothing semantics as validated_apply.
+        Returns
+        -------
+        bool
+            True when the rotation has been applied, False otherwise
+        >>> T = pytromino_factory(Pytromino.Types.T)
+        >>> T.place_at((0, 5))
+        >>> T.rotate_cw()
+        True
+        >>> T # Pointing right, flush against the left wall
+        <Pytromino [(0, 5), (1, 5), (0, 4), (0, 6)], (146, 44, 140), Types.T, (0, 5) >
+        >>> T.rotate_cw(lambda pos: pos[0] >= 0) # Kicked 1 to the right
+        True
+        >>> T
+        <Pytromino [(1, 5), (1, 6), (2, 5), (0, 5)], (146, 44, 140), Types.T, (1, 5) >
+        >>> P = Pytromino([(4, 5), (5, 5), (4, 4), (4, 6)], Color.PURPLE.value, Pytromino.Types.T) # already pointing right
+        >>> P.rotate_cw()
+        True
+        >>> P
+        <Pytromino [(4, 5), (4, 6), (5, 5), (3, 5)], (146, 44, 140), Types.T, (0, 0) >
+        """
+        x0, y0 = self._blocks_pos[0]
+        shape = tuple((x - x0, y - y0) for x, y in self._blocks_pos)
+        rot_index = Pytromino._rot_states(self._type).get(shape)
+        if rot_index is None:
+            return False
+        if self._type is Pytromino.Types.I:
+            kicks = _KICKS_I[rot_index]
+        elif self._type is Pytromino.Types.O:
+            kicks = _KICKS_O
+        else:
+            kicks = _KICKS_JLSTZ[rot_index]
+        ref_x, ref_y = Pytromino._frame(self._type, rot_index)[0]
+        ox, oy = x0 - ref_x, y0 - ref_y
+        frame = Pytromino._frame(self._type, (rot_index + 1) & 3)
+        for dx, dy in kicks:
+            new_blocks = tuple((x + ox + dx, y + oy + dy) for x, y in frame)
+            if self._set_blocks_if_valid(new_blocks, validator):
+                cx, cy = self._center_rot
+                self._center_rot = (cx + dx, cy + dy)
+                return True
+        return False
+
     def get_unique_rows(self):
         """ Returns a list of rows spanned by this pytromino
         """
-        s = set()
-        for pos in self._blocks_pos:
-            s.add(pos[1])
-        return list(s)
+        return list({pos[1] for pos in self._blocks_pos})
 
     def place_at(self, coordinate):
         """ Place this Pytromino at coordinate, can only be called ONCE
@@ -222,22 +330,19 @@ class Pytromino:
         coordinate: (x, y) coordinate
         """
         if not self._placed:
-            self.validated_apply(
-                lambda pos: (
-                    pos[0] + coordinate[0],
-                    pos[1] + coordinate[1]
-                ),
-                False
-            )
+            cx, cy = coordinate
+            self._blocks_pos = tuple((x + cx, y + cy) for x, y in self._blocks_pos)
+            self._center_rot = (self._center_rot[0] + cx, self._center_rot[1] + cy)
             self._placed = True
 
     def is_placed(self):
         return self._placed
 
     def get_blocks_pos(self):
-        """ Returns a COPY of blocks_pos
+        """ Returns blocks_pos as an immutable tuple, shared with *this*
+            pytromino, so no copy is made
         """
-        return self._blocks_pos[:]
+        return self._blocks_pos
 
     def get_color(self):
         """ Returns the color of the Pytromino
@@ -248,41 +353,23 @@ class Pytromino:
         return self._type
 
     def __repr__(self):
-        return f"<Pytromino {self._blocks_pos}, {self._color}, {self._type}, {self._center_rot} >"
+        return f"<Pytromino {list(self._blocks_pos)}, {self._color}, Types.{self._type.name}, {self._center_rot} >"
+
+# Block positions, color and center of rotation indexed by Pytromino type
+_SPECS = [None] * len(Pytromino.Types)
+_SPECS[Pytromino.Types.I] = (((0, 0), (-1, 0), (1, 0), (2, 0)), _CYAN, (0.5, 0.5))
+_SPECS[Pytromino.Types.O] = (((0, 0), (0, -1), (1, -1), (1, 0)), _YELLOW, (0.5, -0.5))
+_SPECS[Pytromino.Types.L] = (((0, 0), (-1, 0), (1, 0), (1, -1)), _ORANGE, (0, 0))
+_SPECS[Pytromino.Types.S] = (((0, 0), (-1, 0), (0, -1), (1, -1)), _GREEN, (0, 0))
+_SPECS[Pytromino.Types.T] = (((0, 0), (0, -1), (-1, 0), (1, 0)), _PURPLE, (0, 0))
+_SPECS[Pytromino.Types.J] = (((0, 0), (-1, -1), (-1, 0), (1, 0)), _BLUE, (0, 0))
+_SPECS[Pytromino.Types.Z] = (((0, 0), (0, -1), (-1, -1), (1, 0)), _RED, (0, 0))
 
 def pytromino_factory(pytromino_type):
-    if pytromino_type == Pytromino.Types.I: # cyan
-        return Pytromino([(0, 0), (-1, 0), (1, 0), (2, 0)],
-                    Color.CYAN.value,
-                    pytromino_type,
-                    center_rot=(0.5, 0.5))
-    elif pytromino_type == Pytromino.Types.O: # yellow
-        return Pytromino([(0, 0), (0, -1), (1, -1), (1, 0)],
-                    Color.YELLOW.value,
-                    pytromino_type,
-                    center_rot=(0.5, -0.5))
-    elif pytromino_type == Pytromino.Types.L: # orange
-        return Pytromino([(0, 0), (-1, 0), (1, 0), (1, -1)],
-                    Color.ORANGE.value,
-                    pytromino_type)
-    elif pytromino_type == Pytromino.Types.S: # green
-        return Pytromino([(0, 0), (-1, 0), (0, -1), (1, -1)],
-                    Color.GREEN.value,
-                    pytromino_type)
-    elif pytromino_type == Pytromino.Types.T: # purple
-        return Pytromino([(0, 0), (0, -1), (-1, 0), (1, 0)],
-                    Color.PURPLE.value,
-                    pytromino_type)
-    elif pytromino_type == Pytromino.Types.J: # blue
-        return Pytromino([(0, 0), (-1, -1), (-1, 0), (1, 0)],
-                    Color.BLUE.value,
-                    pytromino_type)
-    elif pytromino_type == Pytromino.Types.Z: # red
-        return Pytromino([(0, 0), (0, -1), (-1, -1), (1, 0)],
-                    Color.RED.value,
-                    pytromino_type)
-    else:
+    if type(pytromino_type) is not Pytromino.Types:
         raise ValueError(f'Unknown block type: "{pytromino_type}"')
+    spec = _SPECS[pytromino_type]
+    return Pytromino(spec[0], spec[1], pytromino_type, center_rot=spec[2])
 
 
 class Holder:
@@ -290,6 +377,8 @@ class Holder:
         when closed, the item can not be stored or replaced
     """
 
+    __slots__ = ('_item', '_can_store')
+
     def __init__(self):
         """Create an instance of Holder
 
@@ -297,9 +386,12 @@ class Holder:
         >>> holder.is_open()
         True
         >>> holder.store(1)
+        True
         >>> holder.get_item()
         1
         >>> holder.close()
+        >>> holder.store(2)
+        False
         >>> holder.get_item()
         1
         >>> holder.is_open()
@@ -321,8 +413,13 @@ class Holder:
         ----------
         item (any):
             the item to hold
+        Returns
+        -------
+        bool:
+            True if item is stored, False if the holder is closed
         """
-        assert self._can_store, "holder is closed"
+        if not self._can_store:
+            return False
         # TODO: your solution here
 
     def open(self):